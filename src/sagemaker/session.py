@@ -152,7 +152,14 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 "Must setup local AWS configuration with a region supported by SageMaker."
             )
 
-        self.sagemaker_client = sagemaker_client or self.boto_session.client("sagemaker")
+        if sagemaker_client is not None:
+            self.sagemaker_client = sagemaker_client
+        else:
+            # Reuse pooled HTTPS connections across repeated API calls (for
+            # example polling loops and workflow create/describe sequences)
+            # instead of paying a TLS handshake per call.
+            config = botocore.config.Config(max_pool_connections=50)
+            self.sagemaker_client = self.boto_session.client("sagemaker", config=config)
         prepend_user_agent(self.sagemaker_client)
 
         if sagemaker_runtime_client is not None:
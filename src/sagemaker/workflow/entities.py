@@ -28,6 +28,8 @@ class Entity(abc.ABC):
     Entities must implement the to_request method.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_request(self) -> RequestType:
         """Get the request structure for workflow service calls."""
@@ -16,12 +16,12 @@ from __future__ import absolute_import
 import json
 
 import logging
-from copy import deepcopy
+import random
+import time
 from typing import Any, Dict, List, Set, Sequence, Union, Optional
 
 import attr
-import botocore
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, WaiterError
 
 from sagemaker import s3
 from sagemaker._studio import _append_project_tags
@@ -45,14 +45,41 @@ from sagemaker.workflow.utilities import list_to_request
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(request_dict: RequestType) -> str:
+        """Serializes a request dict to a JSON string using orjson."""
+        return orjson.dumps(request_dict).decode("utf-8")
+
+except ImportError:
+    _dumps = json.dumps
+
 _DEFAULT_EXPERIMENT_CFG = PipelineExperimentConfig(
     ExecutionVariables.PIPELINE_NAME, ExecutionVariables.PIPELINE_EXECUTION_ID
 )
 
+_EXPR_TYPES = (Expression, Parameter, Properties)
+
 
 class Pipeline(Entity):
     """Pipeline for workflow."""
 
+    __slots__ = (
+        "name",
+        "parameters",
+        "pipeline_experiment_config",
+        "steps",
+        "sagemaker_session",
+        "_version",
+        "_metadata",
+        "_step_map",
+        "_definition_cache",
+        "_definition_cache_key",
+        "_parameters_request_cache",
+        "_parameters_request_cache_key",
+    )
+
     def __init__(
         self,
         name: str = "",
@@ -92,19 +119,38 @@ class Pipeline(Entity):
         self._metadata = dict()
         self._step_map = dict()
         _generate_step_map(self.steps, self._step_map)
+        self._definition_cache = None
+        self._definition_cache_key = None
+        self._parameters_request_cache = None
+        self._parameters_request_cache_key = None
 
     def to_request(self) -> RequestType:
         """Gets the request structure for workflow service calls."""
         return {
             "Version": self._version,
             "Metadata": self._metadata,
-            "Parameters": list_to_request(self.parameters),
+            "Parameters": self._parameters_to_request(),
             "PipelineExperimentConfig": self.pipeline_experiment_config.to_request()
             if self.pipeline_experiment_config is not None
             else None,
             "Steps": list_to_request(self.steps),
         }
 
+    def _parameters_to_request(self) -> List[RequestType]:
+        """Gets the request structure for the pipeline parameters.
+
+        Parameters rarely change between consecutive create/update/definition
+        calls in one process, so the serialized list is cached and reused until
+        the parameter list is re-bound, resized or reordered.
+        """
+        cache_key = (id(self.parameters), tuple(id(parameter) for parameter in self.parameters))
+        if self._parameters_request_cache is None or cache_key != (
+            self._parameters_request_cache_key
+        ):
+            self._parameters_request_cache = list_to_request(self.parameters)
+            self._parameters_request_cache_key = cache_key
+        return self._parameters_request_cache
+
     def create(
         self,
         role_arn: str,
@@ -132,10 +178,8 @@ class Pipeline(Entity):
             return self.sagemaker_session.sagemaker_client.create_pipeline(self, description)
         tags = _append_project_tags(tags)
         kwargs = self._create_args(role_arn, description, parallelism_config)
-        update_args(
-            kwargs,
-            Tags=tags,
-        )
+        if tags is not None:
+            kwargs["Tags"] = tags
         return self.sagemaker_session.sagemaker_client.create_pipeline(**kwargs)
 
     def _create_args(
@@ -161,14 +205,17 @@ class Pipeline(Entity):
 
         # If pipeline definition is large, upload to S3 bucket and
         # provide PipelineDefinitionS3Location to request instead.
-        if len(pipeline_definition.encode("utf-8")) < 1024 * 100:
+        encoded_definition = pipeline_definition.encode("utf-8")
+        if len(encoded_definition) < 1024 * 100:
             kwargs["PipelineDefinition"] = pipeline_definition
         else:
             desired_s3_uri = s3.s3_path_join(
                 "s3://", self.sagemaker_session.default_bucket(), self.name
             )
+            # upload the already-encoded payload so the multi-MB definition is
+            # not encoded a second time on its way into put_object
             s3.S3Uploader.upload_string_as_file_body(
-                body=pipeline_definition,
+                body=encoded_definition,
                 desired_s3_uri=desired_s3_uri,
                 sagemaker_session=self.sagemaker_session,
             )
@@ -177,9 +224,10 @@ class Pipeline(Entity):
                 "ObjectKey": self.name,
             }
 
-        update_args(
-            kwargs, PipelineDescription=description, ParallelismConfiguration=parallelism_config
-        )
+        if description is not None:
+            kwargs["PipelineDescription"] = description
+        if parallelism_config is not None:
+            kwargs["ParallelismConfiguration"] = parallelism_config
         return kwargs
 
     def describe(self) -> Dict[str, Any]:
@@ -230,6 +278,11 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
     ) -> Dict[str, Any]:
         """Creates a pipeline or updates it, if it already exists.
 
+        The pipeline is created directly and only updated when the service
+        rejects the creation because the name is already taken, so the happy
+        path costs a single API call rather than a describe round trip
+        followed by the create or update.
+
         Args:
             role_arn (str): The role arn that is assumed by workflow to create step artifacts.
             description (str): A description of the pipeline.
@@ -241,33 +294,29 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
         Returns:
             response dict from service
         """
-        exists = True
         try:
-            self.describe()
-        except ClientError as e:
-            err = e.response.get("Error", {})
-            if err.get("Code", None) == "ResourceNotFound":
-                exists = False
-            else:
-                raise e
-
-        if not exists:
             response = self.create(role_arn, description, tags, parallelism_config)
-        else:
-            response = self.update(role_arn, description)
-            if tags is not None:
-                old_tags = self.sagemaker_session.sagemaker_client.list_tags(
-                    ResourceArn=response["PipelineArn"]
-                )["Tags"]
-
-                tag_keys = [tag["Key"] for tag in tags]
-                for old_tag in old_tags:
-                    if old_tag["Key"] not in tag_keys:
-                        tags.append(old_tag)
-
-                self.sagemaker_session.sagemaker_client.add_tags(
-                    ResourceArn=response["PipelineArn"], Tags=tags
-                )
+        except ClientError as ce:
+            error = ce.response.get("Error", {})
+            if error.get("Code") == "ValidationException" and "Pipeline names must be unique" in (
+                error.get("Message", "")
+            ):
+                response = self.update(role_arn, description, parallelism_config)
+                if tags is not None:
+                    old_tags = self.sagemaker_session.sagemaker_client.list_tags(
+                        ResourceArn=response["PipelineArn"]
+                    )["Tags"]
+
+                    tag_keys = [tag["Key"] for tag in tags]
+                    for old_tag in old_tags:
+                        if old_tag["Key"] not in tag_keys:
+                            tags.append(old_tag)
+
+                    self.sagemaker_session.sagemaker_client.add_tags(
+                        ResourceArn=response["PipelineArn"], Tags=tags
+                    )
+            else:
+                raise
         return response
 
     def delete(self) -> Dict[str, Any]:
@@ -300,16 +349,19 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
             A `_PipelineExecution` instance, if successful.
         """
         kwargs = dict(PipelineName=self.name)
-        update_args(
-            kwargs,
-            PipelineExecutionDescription=execution_description,
-            PipelineExecutionDisplayName=execution_display_name,
-            ParallelismConfiguration=parallelism_config,
-        )
+        if execution_description is not None:
+            kwargs["PipelineExecutionDescription"] = execution_description
+        if execution_display_name is not None:
+            kwargs["PipelineExecutionDisplayName"] = execution_display_name
+        if parallelism_config is not None:
+            kwargs["ParallelismConfiguration"] = parallelism_config
         if self.sagemaker_session.local_mode:
-            update_args(kwargs, PipelineParameters=parameters)
+            if parameters is not None:
+                kwargs["PipelineParameters"] = parameters
             return self.sagemaker_session.sagemaker_client.start_pipeline_execution(**kwargs)
-        update_args(kwargs, PipelineParameters=format_start_parameters(parameters))
+        start_parameters = format_start_parameters(parameters)
+        if start_parameters is not None:
+            kwargs["PipelineParameters"] = start_parameters
         response = self.sagemaker_session.sagemaker_client.start_pipeline_execution(**kwargs)
         return _PipelineExecution(
             arn=response["PipelineExecutionArn"],
@@ -317,21 +369,48 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
         )
 
     def definition(self) -> str:
-        """Converts a request structure to string representation for workflow service calls."""
+        """Converts a request structure to string representation for workflow service calls.
+
+        The rendered definition is memoized on a fingerprint of the pipeline
+        attributes it is built from, so call sequences that serialize an
+        unchanged pipeline repeatedly (such as the create/update fallback in
+        `upsert`) only pay the interpolation and serialization cost once. The
+        cache is dropped whenever `steps`, `parameters` or
+        `pipeline_experiment_config` are re-bound, resized or reordered.
+        """
+        cache_key = self._definition_cache_fingerprint()
+        if self._definition_cache is not None and cache_key == self._definition_cache_key:
+            return self._definition_cache
         request_dict = self.to_request()
         self._interpolate_step_collection_name_in_depends_on(request_dict["Steps"])
-        request_dict["PipelineExperimentConfig"] = interpolate(
-            request_dict["PipelineExperimentConfig"], {}, {}
-        )
-        callback_output_to_step_map = _map_callback_outputs(self.steps)
-        lambda_output_to_step_name = _map_lambda_outputs(self.steps)
-        request_dict["Steps"] = interpolate(
-            request_dict["Steps"],
-            callback_output_to_step_map=callback_output_to_step_map,
-            lambda_output_to_step_map=lambda_output_to_step_name,
+        # one interpolation pass covers the experiment config and the steps;
+        # the other sections are literal request structures already and are
+        # passed through by reference
+        request_dict = interpolate(
+            request_dict,
+            callback_output_to_step_map=_map_callback_outputs(self.steps),
+            lambda_output_to_step_map=_map_lambda_outputs(self.steps),
         )
 
-        return json.dumps(request_dict)
+        self._definition_cache = _dumps(request_dict)
+        self._definition_cache_key = cache_key
+        return self._definition_cache
+
+    def _definition_cache_fingerprint(self):
+        """Builds a cheap fingerprint of the attributes that feed `definition`.
+
+        The fingerprint tracks the identity of the step and parameter
+        containers plus the identity of each element, which catches attribute
+        re-assignment and in-place list mutation without traversing step
+        arguments.
+        """
+        return (
+            id(self.steps),
+            tuple(id(step) for step in self.steps),
+            id(self.parameters),
+            tuple(id(parameter) for parameter in self.parameters),
+            id(self.pipeline_experiment_config),
+        )
 
     def _interpolate_step_collection_name_in_depends_on(self, step_requests: list):
         """Insert step names as per `StepCollection` name in depends_on list
@@ -369,7 +448,10 @@ def format_start_parameters(parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     if parameters is None:
         return None
-    return [{"Name": name, "Value": str(value)} for name, value in parameters.items()]
+    return [
+        {"Name": name, "Value": value if isinstance(value, str) else str(value)}
+        for name, value in parameters.items()
+    ]
 
 
 def interpolate(
@@ -388,48 +470,170 @@ def interpolate(
         RequestType: The request dict with Parameter values replaced by their expression.
     """
     try:
-        request_obj_copy = deepcopy(request_obj)
+        expr_subtree_ids = _expr_subtree_ids(request_obj)
+        if not expr_subtree_ids and not isinstance(
+            request_obj, (_EXPR_TYPES, CallbackOutput, LambdaOutput)
+        ):
+            return request_obj
         return _interpolate(
-            request_obj_copy,
+            request_obj,
             callback_output_to_step_map=callback_output_to_step_map,
             lambda_output_to_step_map=lambda_output_to_step_map,
+            expr_subtree_ids=expr_subtree_ids,
         )
     except TypeError as type_err:
         raise TypeError("Not able to interpolate Pipeline definition: %s" % type_err)
 
 
+def _expr_subtree_ids(obj: Union[RequestType, Any]) -> Set[int]:
+    """Collects the ids of containers whose sub-tree requires interpolation.
+
+    A container absent from the returned set holds only literals, so
+    `_interpolate` can share it by reference instead of rebuilding it. For the
+    common pipeline with no parameterized step arguments at all, the returned
+    set is empty and `interpolate` skips the rebuild entirely.
+
+    Args:
+        obj (Union[RequestType, Any]): The request dict.
+    """
+    expr_ids = set()
+    parent_ids = {}
+
+    def _mark(parent_id):
+        # mark every enclosing container, stopping at ancestors that are
+        # already marked
+        up = [parent_id]
+        while up:
+            current = up.pop()
+            if current is None or current in expr_ids:
+                continue
+            expr_ids.add(current)
+            up.extend(parent_ids[current])
+
+    stack = [(None, obj)]
+    while stack:
+        parent_id, value = stack.pop()
+        if isinstance(value, (dict, list, set, tuple)):
+            value_id = id(value)
+            parents = parent_ids.get(value_id)
+            if parents is not None:
+                # the same container can be referenced from several places in
+                # the request tree; keep every parent so each enclosing chain
+                # gets marked, but traverse the children only once
+                parents.append(parent_id)
+                if value_id in expr_ids:
+                    _mark(parent_id)
+                continue
+            parent_ids[value_id] = [parent_id]
+            if isinstance(value, dict):
+                for child in value.values():
+                    stack.append((value_id, child))
+            else:
+                for child in value:
+                    stack.append((value_id, child))
+        elif isinstance(value, (_EXPR_TYPES, CallbackOutput, LambdaOutput)):
+            _mark(parent_id)
+    return expr_ids
+
+
 def _interpolate(
     obj: Union[RequestType, Any],
     callback_output_to_step_map: Dict[str, str],
     lambda_output_to_step_map: Dict[str, str],
+    expr_subtree_ids: Set[int],
 ):
     """Walks the nested request dict, replacing Parameter type values with workflow expressions.
 
+    The walk maintains an explicit stack instead of recursing once per node, so
+    deep request structures pay neither Python frame setup per node nor risk
+    hitting the interpreter recursion limit. Each stack entry is a
+    ``(parent, key, value)`` triple addressing a slot in an already-allocated
+    parent container that the interpolated value is written back into.
+
+    The same Parameter or Properties instance commonly appears in many steps,
+    so resolved `expr` structures are memoized by instance identity for the
+    duration of the walk. The memoized dicts are shared by reference in the
+    result, which is safe because request structures are only serialized, never
+    mutated, downstream.
+
+    Containers whose id is missing from `expr_subtree_ids` hold only literals
+    and are shared by reference in the result rather than rebuilt; this is safe
+    for the same reason the expression memoization is.
+
     Args:
         obj (Union[RequestType, Any]): The request dict.
         callback_output_to_step_map (Dict[str, str]): A dict of output name -> step name.
+        lambda_output_to_step_map (Dict[str, str]): A dict of output name -> step name.
+        expr_subtree_ids (Set[int]): The ids of containers requiring interpolation,
+            as collected by `_expr_subtree_ids`.
     """
-    if isinstance(obj, (Expression, Parameter, Properties)):
-        return obj.expr
-
-    if isinstance(obj, CallbackOutput):
-        step_name = callback_output_to_step_map[obj.output_name]
-        return obj.expr(step_name)
-    if isinstance(obj, LambdaOutput):
-        step_name = lambda_output_to_step_map[obj.output_name]
-        return obj.expr(step_name)
-    if isinstance(obj, dict):
-        new = obj.__class__()
-        for key, value in obj.items():
-            new[key] = interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
-    elif isinstance(obj, (list, set, tuple)):
-        new = obj.__class__(
-            interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
-            for value in obj
-        )
-    else:
-        return obj
-    return new
+    expr_cache = {}
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        # request structures consist almost entirely of plain dicts and lists,
+        # so check those by exact type before falling back to the isinstance
+        # chain; subclasses still take the generic branches below
+        value_type = type(value)
+        if value_type is dict:
+            if id(value) not in expr_subtree_ids:
+                parent[key] = value
+                continue
+            new = {}
+            parent[key] = new
+            for child_key, child_value in reversed(list(value.items())):
+                stack.append((new, child_key, child_value))
+        elif value_type is list:
+            if id(value) not in expr_subtree_ids:
+                parent[key] = value
+                continue
+            new = [None] * len(value)
+            parent[key] = new
+            for index, child_value in enumerate(value):
+                stack.append((new, index, child_value))
+        elif isinstance(value, _EXPR_TYPES):
+            cache_key = id(value)
+            expr = expr_cache.get(cache_key)
+            if expr is None:
+                expr = value.expr
+                expr_cache[cache_key] = expr
+            parent[key] = expr
+        elif isinstance(value, CallbackOutput):
+            parent[key] = value.expr(callback_output_to_step_map[value.output_name])
+        elif isinstance(value, LambdaOutput):
+            parent[key] = value.expr(lambda_output_to_step_map[value.output_name])
+        elif isinstance(value, dict):
+            if id(value) not in expr_subtree_ids:
+                parent[key] = value
+                continue
+            new = value.__class__()
+            parent[key] = new
+            for child_key, child_value in reversed(list(value.items())):
+                stack.append((new, child_key, child_value))
+        elif isinstance(value, list):
+            if id(value) not in expr_subtree_ids:
+                parent[key] = value
+                continue
+            new = value.__class__([None] * len(value))
+            parent[key] = new
+            for index, child_value in enumerate(value):
+                stack.append((new, index, child_value))
+        elif isinstance(value, (set, tuple)):
+            if id(value) not in expr_subtree_ids:
+                parent[key] = value
+                continue
+            # sets and tuples cannot be filled in slot by slot, and are rare in
+            # request structures, so rebuild them eagerly
+            parent[key] = value.__class__(
+                _interpolate(
+                    child, callback_output_to_step_map, lambda_output_to_step_map, expr_subtree_ids
+                )
+                for child in value
+            )
+        else:
+            parent[key] = value
+    return root[0]
 
 
 def _map_callback_outputs(steps: List[Step]):
@@ -475,9 +679,7 @@ def update_args(args: Dict[str, Any], **kwargs):
         request_args (Dict[str, Any]): The request arguments dict.
         kwargs: key, value pairs to update the args dict with.
     """
-    for key, value in kwargs.items():
-        if value is not None:
-            args.update({key: value})
+    args.update({key: value for key, value in kwargs.items() if value is not None})
 
 
 def _generate_step_map(
@@ -494,7 +696,17 @@ def _generate_step_map(
             _generate_step_map(step.steps, step_map)
 
 
-@attr.s
+_WAITER_ID = "PipelineExecutionComplete"
+
+# polling configuration for _PipelineExecution.wait(): the interval grows by
+# _WAIT_BACKOFF_RATE per attempt up to _WAIT_MAX_DELAY seconds, spread with
+# +/- _WAIT_JITTER to avoid synchronized polling across executions
+_WAIT_BACKOFF_RATE = 1.5
+_WAIT_MAX_DELAY = 300
+_WAIT_JITTER = 0.2
+
+
+@attr.s(slots=True)
 class _PipelineExecution:
     """Internal class for encapsulating pipeline execution instances.
 
@@ -542,45 +754,40 @@ sagemaker.html#SageMaker.Client.list_pipeline_execution_steps>`_.
         return response["PipelineExecutionSteps"]
 
     def wait(self, delay=30, max_attempts=60):
-        """Waits for a pipeline execution.
+        """Waits for a pipeline execution to reach a terminal status.
+
+        The execution is polled with `DescribePipelineExecution`. The interval
+        between polls starts at `delay` seconds and backs off exponentially
+        (with jitter) up to five minutes, which keeps the API call count low
+        for long-running executions without delaying completion detection for
+        short ones.
 
         Args:
-            delay (int): The polling interval. (Defaults to 30 seconds)
+            delay (int): The initial polling interval. (Defaults to 30 seconds)
             max_attempts (int): The maximum number of polling attempts.
                 (Defaults to 60 polling attempts)
+
+        Raises:
+            botocore.exceptions.WaiterError: If the execution fails or does not
+                reach a terminal status within `max_attempts` polls.
         """
-        waiter_id = "PipelineExecutionComplete"
-        # TODO: this waiter should be included in the botocore
-        model = botocore.waiter.WaiterModel(
-            {
-                "version": 2,
-                "waiters": {
-                    waiter_id: {
-                        "delay": delay,
-                        "maxAttempts": max_attempts,
-                        "operation": "DescribePipelineExecution",
-                        "acceptors": [
-                            {
-                                "expected": "Succeeded",
-                                "matcher": "path",
-                                "state": "success",
-                                "argument": "PipelineExecutionStatus",
-                            },
-                            {
-                                "expected": "Failed",
-                                "matcher": "path",
-                                "state": "failure",
-                                "argument": "PipelineExecutionStatus",
-                            },
-                        ],
-                    }
-                },
-            }
-        )
-        waiter = botocore.waiter.create_waiter_with_client(
-            waiter_id, model, self.sagemaker_session.sagemaker_client
-        )
-        waiter.wait(PipelineExecutionArn=self.arn)
+        response = None
+        interval = delay
+        for attempt in range(max_attempts):
+            response = self.describe()
+            status = response["PipelineExecutionStatus"]
+            if status == "Succeeded":
+                return
+            if status == "Failed":
+                raise WaiterError(
+                    name=_WAITER_ID,
+                    reason="Waiter encountered a terminal failure state",
+                    last_response=response,
+                )
+            if attempt < max_attempts - 1:
+                time.sleep(interval * random.uniform(1 - _WAIT_JITTER, 1 + _WAIT_JITTER))
+                interval = min(interval * _WAIT_BACKOFF_RATE, _WAIT_MAX_DELAY)
+        raise WaiterError(name=_WAITER_ID, reason="Max attempts exceeded", last_response=response)
 
 
 class PipelineGraph:
@@ -17,14 +17,15 @@ import json
 
 import pytest
 
-from mock import Mock
+from botocore.exceptions import ClientError, WaiterError
+from mock import Mock, patch
 
 from sagemaker import s3
 from sagemaker.workflow.condition_step import ConditionStep
 from sagemaker.workflow.conditions import ConditionEquals
 from sagemaker.workflow.execution_variables import ExecutionVariables
 from sagemaker.workflow.parameters import ParameterString
-from sagemaker.workflow.pipeline import Pipeline, PipelineGraph
+from sagemaker.workflow.pipeline import Pipeline, PipelineGraph, _PipelineExecution
 from sagemaker.workflow.parallelism_config import ParallelismConfiguration
 from sagemaker.workflow.pipeline_experiment_config import (
     PipelineExperimentConfig,
@@ -175,10 +176,16 @@ def test_large_pipeline_update(sagemaker_session_mock, role_arn):
     )
 
 
-def test_pipeline_upsert(sagemaker_session_mock, role_arn):
-    sagemaker_session_mock.sagemaker_client.describe_pipeline.return_value = {
-        "PipelineArn": "pipeline-arn"
-    }
+def test_pipeline_upsert_updates_existing_pipeline(sagemaker_session_mock, role_arn):
+    sagemaker_session_mock.sagemaker_client.create_pipeline.side_effect = ClientError(
+        operation_name="CreatePipeline",
+        error_response={
+            "Error": {
+                "Code": "ValidationException",
+                "Message": "Pipeline names must be unique within an AWS account and region",
+            }
+        },
+    )
     sagemaker_session_mock.sagemaker_client.update_pipeline.return_value = {
         "PipelineArn": "pipeline-arn"
     }
@@ -199,19 +206,52 @@ def test_pipeline_upsert(sagemaker_session_mock, role_arn):
     ]
     pipeline.upsert(role_arn=role_arn, tags=tags)
 
-    sagemaker_session_mock.sagemaker_client.create_pipeline.assert_not_called()
-
+    sagemaker_session_mock.sagemaker_client.update_pipeline.assert_called_once()
     assert sagemaker_session_mock.sagemaker_client.update_pipeline.called_with(
         PipelineName="MyPipeline", PipelineDefinition=pipeline.definition(), RoleArn=role_arn
     )
-    assert sagemaker_session_mock.sagemaker_client.list_tags.called_with(
-        ResourceArn="mock_pipeline_arn"
-    )
+    assert sagemaker_session_mock.sagemaker_client.list_tags.called_with(ResourceArn="pipeline-arn")
 
     tags.append({"Key": "dummy", "Value": "dummy_tag"})
     assert sagemaker_session_mock.sagemaker_client.add_tags.called_with(
-        ResourceArn="mock_pipeline_arn", Tags=tags
+        ResourceArn="pipeline-arn", Tags=tags
+    )
+
+
+def test_pipeline_upsert_creates_new_pipeline(sagemaker_session_mock, role_arn):
+    pipeline = Pipeline(
+        name="MyPipeline",
+        parameters=[],
+        steps=[],
+        sagemaker_session=sagemaker_session_mock,
+    )
+    pipeline.upsert(role_arn=role_arn)
+
+    sagemaker_session_mock.sagemaker_client.create_pipeline.assert_called_once()
+    sagemaker_session_mock.sagemaker_client.update_pipeline.assert_not_called()
+    sagemaker_session_mock.sagemaker_client.describe_pipeline.assert_not_called()
+
+
+def test_pipeline_upsert_resurfaces_other_create_errors(sagemaker_session_mock, role_arn):
+    sagemaker_session_mock.sagemaker_client.create_pipeline.side_effect = ClientError(
+        operation_name="CreatePipeline",
+        error_response={
+            "Error": {
+                "Code": "AccessDeniedException",
+                "Message": "user is not authorized to perform sagemaker:CreatePipeline",
+            }
+        },
+    )
+    pipeline = Pipeline(
+        name="MyPipeline",
+        parameters=[],
+        steps=[],
+        sagemaker_session=sagemaker_session_mock,
     )
+    with pytest.raises(ClientError):
+        pipeline.upsert(role_arn=role_arn)
+
+    sagemaker_session_mock.sagemaker_client.update_pipeline.assert_not_called()
 
 
 def test_pipeline_delete(sagemaker_session_mock):
@@ -434,6 +474,34 @@ def test_pipeline_disable_experiment_config():
     )
 
 
+def test_pipeline_metadata_is_per_instance(sagemaker_session_mock):
+    pipeline1 = Pipeline(name="MyPipeline1", sagemaker_session=sagemaker_session_mock)
+    pipeline2 = Pipeline(name="MyPipeline2", sagemaker_session=sagemaker_session_mock)
+
+    pipeline1._metadata["experiment"] = "my-experiment"
+    assert pipeline2._metadata == {}
+
+
+def test_pipeline_definition_is_cached_until_steps_change(sagemaker_session_mock):
+    pipeline = Pipeline(
+        name="MyPipeline",
+        parameters=[ParameterString("MyStr1")],
+        steps=[CustomStep(name="MyStep1", input_data="input")],
+        sagemaker_session=sagemaker_session_mock,
+    )
+    definition = pipeline.definition()
+    assert pipeline.definition() is definition
+
+    pipeline.steps = [CustomStep(name="MyStep2", input_data="input")]
+    assert "MyStep2" in pipeline.definition()
+
+    pipeline.steps.append(CustomStep(name="MyStep3", input_data="input"))
+    assert "MyStep3" in pipeline.definition()
+
+    pipeline.parameters[0] = ParameterString("MyStr2")
+    assert "MyStr2" in pipeline.definition()
+
+
 def test_pipeline_execution_basics(sagemaker_session_mock):
     sagemaker_session_mock.sagemaker_client.start_pipeline_execution.return_value = {
         "PipelineExecutionArn": "my:arn"
@@ -463,6 +531,47 @@ def test_pipeline_execution_basics(sagemaker_session_mock):
     assert len(steps) == 1
 
 
+@patch("sagemaker.workflow.pipeline.time.sleep", Mock())
+def test_pipeline_execution_wait_polls_until_success(sagemaker_session_mock):
+    sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.side_effect = [
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Succeeded"},
+    ]
+    execution = _PipelineExecution(arn="my:arn", sagemaker_session=sagemaker_session_mock)
+    execution.wait()
+    assert sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.call_count == 3
+
+
+@patch("sagemaker.workflow.pipeline.time.sleep", Mock())
+def test_pipeline_execution_wait_raises_on_failure(sagemaker_session_mock):
+    sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.return_value = {
+        "PipelineExecutionStatus": "Failed",
+        "FailureReason": "CallbackStep timed out",
+    }
+    execution = _PipelineExecution(arn="my:arn", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(WaiterError, match="terminal failure"):
+        execution.wait()
+
+
+@patch("sagemaker.workflow.pipeline.time.sleep", Mock())
+def test_pipeline_execution_wait_raises_when_attempts_exhausted(sagemaker_session_mock):
+    sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.return_value = {
+        "PipelineExecutionStatus": "Executing"
+    }
+    execution = _PipelineExecution(arn="my:arn", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(WaiterError, match="Max attempts exceeded"):
+        execution.wait(delay=1, max_attempts=3)
+    assert sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.call_count == 3
+
+
+def test_pipeline_execution_wait_raises_without_polling_when_no_attempts(sagemaker_session_mock):
+    execution = _PipelineExecution(arn="my:arn", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(WaiterError, match="Max attempts exceeded"):
+        execution.wait(max_attempts=0)
+    sagemaker_session_mock.sagemaker_client.describe_pipeline_execution.assert_not_called()
+
+
 def _generate_large_pipeline_steps(input_data: object):
     steps = []
     for i in range(2000):